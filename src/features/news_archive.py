@@ -0,0 +1,152 @@
+import os
+import re
+import time
+import sqlite3
+import calendar
+from datetime import datetime
+
+# The archive lives next to projects.json and schedule.json in the A.C.E. root.
+ACE_ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+ARCHIVE_FILE = os.path.join(ACE_ROOT_DIR, "news_archive.db")
+
+# --- Retention: the archive is pruned by both age and size after every write ---
+MAX_ARCHIVE_AGE_DAYS = 90
+MAX_ARCHIVE_ENTRIES = 5000
+
+SINCE_UNITS = {"m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY,
+    link TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    source TEXT NOT NULL,
+    published REAL NOT NULL,
+    fetched_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_published ON entries(published);
+CREATE INDEX IF NOT EXISTS entries_fetched_at ON entries(fetched_at);
+CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5(
+    title, content='entries', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS entries_ai AFTER INSERT ON entries BEGIN
+    INSERT INTO entries_fts(rowid, title) VALUES (new.id, new.title);
+END;
+CREATE TRIGGER IF NOT EXISTS entries_ad AFTER DELETE ON entries BEGIN
+    INSERT INTO entries_fts(entries_fts, rowid, title) VALUES ('delete', old.id, old.title);
+END;
+"""
+
+def connect(path=ARCHIVE_FILE):
+    """Opens the archive database, creating the tables on first use."""
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    return conn
+
+def entry_timestamp(entry, default):
+    """Returns the entry's publish time as a Unix timestamp, or 'default' if the feed has none."""
+    published = entry.get("published_parsed") or entry.get("updated_parsed")
+    if published:
+        return calendar.timegm(published)
+    return default
+
+def archive_entries(source_name, entries, path=ARCHIVE_FILE):
+    """
+    Stores feed entries in the archive, then applies the retention limits.
+    Links that are already archived only get their 'fetched_at' refreshed, so articles
+    a feed keeps listing stay in the archive. Returns the number of new entries stored.
+    """
+    now = time.time()
+    rows = []
+    for entry in entries:
+        link = entry.get("link")
+        if not link:
+            continue
+        rows.append((link, entry.get("title", "No Title"), source_name, entry_timestamp(entry, now), now))
+
+    conn = connect(path)
+    try:
+        with conn:
+            count_before = conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            conn.executemany(
+                "INSERT INTO entries (link, title, source, published, fetched_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(link) DO UPDATE SET fetched_at = excluded.fetched_at",
+                rows
+            )
+            added = conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0] - count_before
+            prune(conn, now)
+        return added
+    finally:
+        conn.close()
+
+def prune(conn, now):
+    """
+    Drops entries last fetched more than MAX_ARCHIVE_AGE_DAYS ago, then the least recently
+    fetched ones beyond MAX_ARCHIVE_ENTRIES. Both use 'fetched_at', which archive_entries()
+    refreshes on every fetch, so an article a feed still lists is never aged out.
+    """
+    cutoff = now - MAX_ARCHIVE_AGE_DAYS * 86400
+    conn.execute("DELETE FROM entries WHERE fetched_at < ?", (cutoff,))
+    conn.execute(
+        "DELETE FROM entries WHERE id NOT IN "
+        "(SELECT id FROM entries ORDER BY fetched_at DESC, id DESC LIMIT ?)",
+        (MAX_ARCHIVE_ENTRIES,)
+    )
+
+def parse_since(since):
+    """
+    Turns a '--since' value into a Unix timestamp.
+    Accepts relative ages like '30m', '12h', '3d', '2w' or a date like '2025-01-31'.
+    """
+    match = re.fullmatch(r"(\d+)\s*([mhdw])", since.strip().lower())
+    if match:
+        amount, unit = match.groups()
+        return time.time() - int(amount) * SINCE_UNITS[unit]
+    try:
+        return datetime.fromisoformat(since.strip()).timestamp()
+    except ValueError:
+        raise ValueError(f"Invalid --since value '{since}'. Use e.g. '12h', '3d', '2w' or 'YYYY-MM-DD'.")
+
+def build_match_query(query):
+    """Quotes every word of the user's query so FTS5 treats it as plain text, not query syntax."""
+    terms = re.findall(r"\w+", query)
+    return " ".join(f'"{term}"' for term in terms)
+
+def search(query, since=None, source_name=None, limit=20, path=ARCHIVE_FILE):
+    """
+    Searches archived headlines with the full-text index.
+
+    Args:
+        query (str): Words to look for in the headline titles.
+        since (str): Optional '--since' value limiting results by publish time.
+        source_name (str): Optional news source to restrict the search to.
+        limit (int): The maximum number of results to return.
+
+    Returns:
+        A list of (title, link, source, published) tuples, best match first.
+    """
+    match_query = build_match_query(query)
+    if not match_query:
+        return []
+
+    sql = (
+        "SELECT e.title, e.link, e.source, e.published FROM entries_fts "
+        "JOIN entries e ON e.id = entries_fts.rowid WHERE entries_fts MATCH ?"
+    )
+    params = [match_query]
+    if since:
+        sql += " AND e.published >= ?"
+        params.append(parse_since(since))
+    if source_name:
+        sql += " AND e.source = ?"
+        params.append(source_name.lower())
+    sql += " ORDER BY entries_fts.rank, e.published DESC LIMIT ?"
+    params.append(limit)
+
+    if not os.path.exists(path):
+        return []
+    conn = connect(path)
+    try:
+        return conn.execute(sql, params).fetchall()
+    finally:
+        conn.close()
@@ -1,11 +1,15 @@
+import sqlite3
 import feedparser
+from datetime import datetime
+from src.features import news_archive
+from src.features import news_seen
 
 NEWS_SOURCES = {
     "hackernews": "https://news.ycombinator.com/rss",
     "techcrunch": "https://techcrunch.com/feed/",
 }
 
-def get_news(source_name="hackernews", limit=7):
+def get_news(source_name="hackernews", limit=7, new_only=False):
     """
     Fetches the latest news from a specified source's RSS feed.
 
@@ -13,6 +17,7 @@ def get_news(source_name="hackernews", limit=7):
         source_name (str): The nickname of the news source from out dictionary.
                            Defaults to 'hackernews'.
         limit (int): The maximum number of articles to return. Defaults to 7.
+        new_only (bool): Only return articles that have not been shown before.
 
     Returns:
         A list of formatted news headlines or an error string.
@@ -31,6 +36,15 @@ def get_news(source_name="hackernews", limit=7):
         print(f"Fetching latest news from {source_name.title()}...")
         news_feed = feedparser.parse(source_url)
 
+        # Keep every fetched entry in the local archive so it can be searched later.
+        try:
+            news_archive.archive_entries(source_name.lower(), news_feed.entries)
+        except sqlite3.Error as e:
+            print(f"Warning: Could not archive headlines: {e}")
+
+        if new_only:
+            return get_new_headlines(source_name, news_feed.entries, limit)
+
         # We need an empty list to hold the formatted headlines.
         headlines = []
 
@@ -51,3 +65,65 @@ def get_news(source_name="hackernews", limit=7):
 
     except Exception as e:
         return [f"An error occurred while fetching news: {e}"]
+
+
+def get_new_headlines(source_name, entries, limit):
+    """
+    Returns up to 'limit' headlines that have not been shown for this source before,
+    and remembers them in the source's seen-set.
+    The whole feed is scanned, since earlier runs cut short by 'limit' can leave
+    unshown entries below ones that were already shown.
+    """
+    seen = news_seen.SeenSet.load(news_seen.seen_file(source_name))
+    headlines = []
+
+    for entry in entries:
+        title = entry.get("title", "No Title")
+        link = entry.get("link", "#")
+
+        # Entries are remembered by link; ones without a link fall back to their title,
+        # so they are still shown once like in plain 'ace news'.
+        seen_key = entry.get("link") or f"title:{title}"
+        if seen_key in seen:
+            continue
+
+        seen.add(seen_key)
+        headlines.append(f"  - {title}\n    Link: {link}")
+        if len(headlines) >= limit:
+            break
+
+    if headlines:
+        seen.save()
+        return headlines
+    else:
+        return [f"No new articles for source '{source_name}'."]
+
+def search_news(query, since=None, source_name=None, limit=20):
+    """
+    Searches the local headline archive instead of fetching the feeds again.
+
+    Args:
+        query (str): Words to look for in the headline titles.
+        since (str): Only include articles published since then (e.g. '3d', '2025-01-31').
+        source_name (str): Optionally restrict the search to one news source.
+        limit (int): The maximum number of articles to return. Defaults to 20.
+
+    Returns:
+        A list of formatted news headlines or an error string.
+    """
+    try:
+        results = news_archive.search(query, since=since, source_name=source_name, limit=limit)
+    except ValueError as e:
+        return [f"Error: {e}"]
+    except sqlite3.Error as e:
+        return [f"An error occurred while searching the archive: {e}"]
+
+    headlines = []
+    for title, link, source, published in results:
+        date = datetime.fromtimestamp(published).strftime("%Y-%m-%d %H:%M")
+        headlines.append(f"  - {title}\n    {source.title()} | {date} | Link: {link}")
+
+    if headlines:
+        return headlines
+    else:
+        return [f"No archived articles match '{query}'."]
@@ -0,0 +1,78 @@
+import os
+import struct
+import hashlib
+
+ACE_ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+# --- Bloom filter sizing ---
+# Each source keeps two generations of BLOOM_BITS bits. Once the current generation
+# holds GENERATION_CAPACITY links it becomes the previous one and a fresh one starts,
+# so the file stays the same size (about 8 KiB) however long the scheduler runs,
+# and the false-positive rate stays well under 1%.
+BLOOM_BITS = 2 ** 15
+BLOOM_HASHES = 5
+GENERATION_CAPACITY = 2000
+
+HEADER = struct.Struct("<I")
+
+def seen_file(source_name):
+    """Returns the path of the seen-set file for a news source."""
+    return os.path.join(ACE_ROOT_DIR, f"news_seen_{source_name.lower()}.bin")
+
+class SeenSet:
+    """A fixed-size, two-generation Bloom filter of links that have already been shown."""
+
+    def __init__(self, path):
+        self.path = path
+        self.count = 0
+        self.current = bytearray(BLOOM_BITS // 8)
+        self.previous = bytearray(BLOOM_BITS // 8)
+
+    @classmethod
+    def load(cls, path):
+        """Loads a seen-set from disk, starting empty if the file is missing or corrupt."""
+        seen = cls(path)
+        size = BLOOM_BITS // 8
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return seen
+        if len(data) == HEADER.size + 2 * size:
+            seen.count = HEADER.unpack_from(data)[0]
+            seen.current = bytearray(data[HEADER.size:HEADER.size + size])
+            seen.previous = bytearray(data[HEADER.size + size:])
+        return seen
+
+    def save(self):
+        """Writes the seen-set to disk atomically, so an interrupted job cannot corrupt it."""
+        temp_path = self.path + ".tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(HEADER.pack(self.count) + bytes(self.current) + bytes(self.previous))
+        os.replace(temp_path, self.path)
+
+    @staticmethod
+    def bit_positions(key):
+        """Derives BLOOM_HASHES bit positions from one digest using double hashing."""
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * second) % BLOOM_BITS for i in range(BLOOM_HASHES)]
+
+    @staticmethod
+    def has_bits(bits, positions):
+        return all(bits[p >> 3] & (1 << (p & 7)) for p in positions)
+
+    def __contains__(self, key):
+        positions = self.bit_positions(key)
+        return self.has_bits(self.current, positions) or self.has_bits(self.previous, positions)
+
+    def add(self, key):
+        """Marks a key as seen, rotating generations when the current one is full."""
+        if self.count >= GENERATION_CAPACITY:
+            self.previous = self.current
+            self.current = bytearray(BLOOM_BITS // 8)
+            self.count = 0
+        for p in self.bit_positions(key):
+            self.current[p >> 3] |= 1 << (p & 7)
+        self.count += 1
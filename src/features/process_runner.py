@@ -0,0 +1,100 @@
+import os
+import codecs
+import signal
+import asyncio
+from collections import namedtuple
+
+# How many bytes of streamed output are read at a time when 'on_output' is set.
+STREAM_CHUNK_SIZE = 4096
+
+# How many child processes may run at the same time across a single run_many() call.
+DEFAULT_CONCURRENCY = 32
+
+ProcessResult = namedtuple("ProcessResult", ["returncode", "stdout", "stderr", "timed_out"])
+
+async def run(argv, cwd=None, timeout=None, on_output=None, env=None):
+    """
+    Runs a command given as an argument list (no shell) and captures its output.
+
+    Args:
+        argv (list): The program and its arguments, e.g. ["git", "status"].
+        cwd (str): The directory to run the command in.
+        timeout (float): Seconds to wait before the process, and everything it started, is killed.
+                         None waits forever.
+        on_output (callable): Optional callback receiving stdout text as soon as it arrives,
+                              including partial lines such as prompts. When set, stderr
+                              is merged into stdout.
+        env (dict): The environment for the process. None inherits the current one.
+
+    Returns:
+        A ProcessResult. A program that cannot be found raises FileNotFoundError.
+    """
+    process = await asyncio.create_subprocess_exec(
+        *argv,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT if on_output else asyncio.subprocess.PIPE,
+        cwd=cwd,
+        env=env,
+        # Its own process group, so a kill also reaches the programs the command started.
+        start_new_session=True
+    )
+
+    async def collect():
+        if on_output is None:
+            return await process.communicate()
+        # Read fixed-size chunks instead of lines, so prompts without a newline show up
+        # immediately and very long lines cannot overrun the stream reader's buffer.
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        chunks = []
+        while True:
+            data = await process.stdout.read(STREAM_CHUNK_SIZE)
+            text = decoder.decode(data, final=not data)
+            if text:
+                chunks.append(text)
+                on_output(text)
+            if not data:
+                break
+        await process.wait()
+        return "".join(chunks).encode(), b""
+
+    timed_out = False
+    try:
+        stdout, stderr = await asyncio.wait_for(collect(), timeout)
+    except asyncio.TimeoutError:
+        timed_out = True
+    finally:
+        # Never leave orphaned processes behind, whatever stopped us reading from the child:
+        # kill its whole process group, not just the direct child.
+        if process.returncode is None:
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            await process.wait()
+
+    if timed_out:
+        return ProcessResult(process.returncode, "", f"Timed out after {timeout} seconds.", True)
+
+    return ProcessResult(
+        process.returncode,
+        stdout.decode(errors="replace").strip(),
+        stderr.decode(errors="replace").strip(),
+        False
+    )
+
+async def run_many(commands, concurrency=DEFAULT_CONCURRENCY, timeout=None):
+    """
+    Runs many (argv, cwd) commands concurrently, at most 'concurrency' at a time.
+    Returns the ProcessResults in the same order as the commands.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(argv, cwd):
+        async with semaphore:
+            return await run(argv, cwd=cwd, timeout=timeout)
+
+    return await asyncio.gather(*(bounded(argv, cwd) for argv, cwd in commands))
+
+def run_sync(argv, cwd=None, timeout=None, on_output=None, env=None):
+    """A blocking wrapper around run() for callers that are not async themselves."""
+    return asyncio.run(run(argv, cwd=cwd, timeout=timeout, on_output=on_output, env=env))
@@ -3,7 +3,12 @@
 # ==============================================================================
 
 import os
+import time
+import shlex
+import shutil
 import subprocess
+import concurrent.futures
+from src.features import process_runner
 
 # --- Configuration: Define the commands for each template ---
 SCAFFOLD_COMMANDS = {
@@ -18,9 +23,72 @@ SCAFFOLD_COMMANDS = {
     "python": "echo 'Python template coming soon!'" 
 }
 
-def create_project(project_name, template, location):
+# --- Configuration: The shared package store used by the optional install stage ---
+# pnpm keeps every package version once in the content-addressed 'store' and hard-links
+# it into each project's node_modules, so new projects reuse what is already cached.
+# The package metadata pnpm needs to resolve versions offline lives in 'cache', so both
+# sit under one root: seeding that root is enough for a fully offline install.
+PACKAGE_STORE_DIR = os.path.expanduser(os.getenv("ACE_PACKAGE_STORE", "~/.ace/package-store"))
+INSTALL_COMMAND = [
+    "pnpm", "install",
+    "--store-dir", os.path.join(PACKAGE_STORE_DIR, "store"),
+    "--cache-dir", os.path.join(PACKAGE_STORE_DIR, "cache"),
+]
+# Seconds the install stage may take before it is stopped.
+INSTALL_TIMEOUT = 900
+
+def needs_install(project_path):
+    """Returns True if the project has a package.json but no installed dependencies yet."""
+    return (os.path.isfile(os.path.join(project_path, "package.json"))
+            and not os.path.isdir(os.path.join(project_path, "node_modules")))
+
+def install_dependencies(project_path):
+    """
+    Installs a new project's dependencies from the shared package store.
+    It first tries a fully offline install, which succeeds when the store and metadata cache
+    are already warm, and only falls back to the network for packages that are not cached yet.
+    A failed install removes the partial node_modules it leaves behind.
+
+    Returns:
+        A tuple of (installed, report), where 'installed' is True if the install succeeded.
+    """
+    start_time = time.perf_counter()
+    failed_attempts = []
+    try:
+        result = process_runner.run_sync(INSTALL_COMMAND + ["--offline"], cwd=project_path, timeout=INSTALL_TIMEOUT)
+        mode = "offline, from the shared store"
+        if result.returncode != 0 and not result.timed_out:
+            failed_attempts.append(("Offline install", result))
+            result = process_runner.run_sync(INSTALL_COMMAND + ["--prefer-offline"], cwd=project_path, timeout=INSTALL_TIMEOUT)
+            mode = "using the shared store, downloading missing packages"
+    except FileNotFoundError:
+        return False, "\n⚠️  Skipped dependency install: 'pnpm' was not found."
+    elapsed = time.perf_counter() - start_time
+
+    if result.returncode != 0:
+        failed_attempts.append(("Install", result))
+        shutil.rmtree(os.path.join(project_path, "node_modules"), ignore_errors=True)
+        report = f"\n❌ Error: Dependency install failed after {elapsed:.1f}s."
+        for name, attempt in failed_attempts:
+            output = "\n".join(part for part in (attempt.stdout, attempt.stderr) if part)
+            report += f"\n\n{name} output:\n{output}"
+        return False, report
+    return True, f"\n✅ Dependencies installed in {elapsed:.1f}s ({mode}: {PACKAGE_STORE_DIR})."
+
+def next_steps(project_path, install_step="npm install"):
+    """Builds the 'Next steps' list. Pass install_step=None once dependencies are installed."""
+    steps = [f"cd {project_path}"]
+    if install_step:
+        steps.append(install_step)
+    steps.append("npm run dev")
+    return "Next steps:\n" + "\n".join(f"  {number}. {step}" for number, step in enumerate(steps, 1))
+
+def create_project(project_name, template, location, install=False):
     """
     Creates a new project using an external scaffolding tool.
+    With 'install', dependencies are installed from the shared package store in the
+    background while the success message is shown, and the install report is returned
+    along with the next steps.
     """
     template = template.strip().lower()
     
@@ -58,14 +126,24 @@ def create_project(project_name, template, location):
         # This new block creates a more helpful success message that tells the
         # user exactly what to do next.
         project_path = os.path.join(location, project_name)
-        success_message = (
-            f"\n✅ Success! Project '{project_name}' has been created at '{location}'.\n\n"
-            f"Next steps:\n"
-            f"  1. cd {project_path}\n"
-            f"  2. npm install\n"
-            f"  3. npm run dev"
-        )
-        return success_message
+        success_message = f"\n✅ Success! Project '{project_name}' has been created at '{location}'."
+        if not (install and needs_install(project_path)):
+            return f"{success_message}\n\n{next_steps(project_path)}"
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            install_job = executor.submit(install_dependencies, project_path)
+            print(f"{success_message}\n\nInstalling dependencies in the background...")
+            installed, install_report = install_job.result()
+
+        # Only drop the install step once the install has actually succeeded. If pnpm is
+        # available, retrying should go through the same shared store, not another package manager.
+        if installed:
+            install_step = None
+        elif shutil.which("pnpm"):
+            install_step = shlex.join(INSTALL_COMMAND)
+        else:
+            install_step = "npm install"
+        return f"{install_report}\n\n{next_steps(project_path, install_step)}"
 
     except FileNotFoundError:
         return f"Error: The command '{command_to_run.split()[0]}' was not found. Please ensure it is installed and in your PATH."
@@ -2,13 +2,16 @@ import os
 import json
 import schedule
 import time
-import subprocess
 import sys
+from src.features import process_runner
 
 # This logic correctly finds the A.C.E. root directory.
 ACE_ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
 SCHEDULE_FILE = os.path.join(ACE_ROOT_DIR, "schedule.json")
 
+# Seconds a scheduled job may run before it is killed, so one stuck job cannot block the watcher.
+JOB_TIMEOUT = 600
+
 def load_schedule():
     """Safely loads the schedule from the JSON file."""
     try:
@@ -66,17 +69,22 @@ def run_job(command_string):
     
     python_executable = sys.executable
     command_args = command_string.split()[1:]
-    full_command = [python_executable, "-m", "src.main"] + command_args
+    # '-u' keeps the job's output unbuffered, so it streams live through the pipe.
+    full_command = [python_executable, "-u", "-m", "src.main"] + command_args
 
     try:
-        subprocess.run(
-            full_command, 
-            check=True,
-            cwd=ACE_ROOT_DIR
+        result = process_runner.run_sync(
+            full_command,
+            cwd=ACE_ROOT_DIR,
+            timeout=JOB_TIMEOUT,
+            on_output=lambda text: print(text, end='', flush=True)
         )
-        print(f"--- Job Finished: {command_string} ---")
-    except subprocess.CalledProcessError as e:
-        print(f"--- Job Failed: {command_string} with error code {e.returncode} ---")
+        if result.timed_out:
+            print(f"--- Job Failed: {command_string} timed out after {JOB_TIMEOUT} seconds ---")
+        elif result.returncode != 0:
+            print(f"--- Job Failed: {command_string} with error code {result.returncode} ---")
+        else:
+            print(f"--- Job Finished: {command_string} ---")
     except Exception as e:
         print(f"--- An unexpected error occurred: {e} ---")
 
@@ -1,57 +1,74 @@
 import os
-import subprocess
 import json
-import concurrent.futures
+import asyncio
+from src.features import process_runner
 
 ACE_ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
 PROJECTS_FILE = os.path.join(ACE_ROOT_DIR, "projects.json")
 
-def run_command(command, cwd):
+# Seconds a single git probe may take before it is killed.
+GIT_TIMEOUT = 30
+
+STATUS_COMMAND = ["git", "status", "--porcelain"]
+LAST_COMMIT_COMMAND = ["git", "log", "-n", "1", "--pretty=format:%s (%cr)"]
+
+def run_command(argv, cwd, timeout=None):
     """
-    Runs a terminal command in a  specified directory (cwd) and returns its output.
+    Runs a command (as an argument list, no shell) in a specified directory (cwd) and returns its output.
     """
-    result = subprocess.run(
-        command, 
-        shell=True,
-        capture_output=True,
-        text=True,
-        cwd=cwd
-    )
+    try:
+        result = process_runner.run_sync(argv, cwd=cwd, timeout=timeout)
+    except FileNotFoundError:
+        return None, f"Command '{argv[0]}' was not found."
     if result.returncode != 0:
-        return None, result.stderr.strip()
-    return result.stdout.strip(), None
+        return None, result.stderr
+    return result.stdout, None
 
-def check_project_status(project_info):
+def format_project_status(nickname, status_result, log_result):
     """
-    Checks the Git status and last commit for a single project.
-    Thhis is the function that each thread will run in parallel.
+    Builds the overview entry for a single project from its 'git status' and 'git log' results.
     """
-
-    # Unpack project
-    nickname, details = project_info
-    project_path = details['local_path']
-
-    if not os.path.isdir(project_path):
-        return f"\n   - {nickname}:\n    Status: Path not found."
-
-    # Use git status
-    status, error = run_command("git  status --porcelain", cwd=project_path)
-    if error:
+    if status_result.timed_out:
+        return f"  - {nickname}:\n  Status: Timed out after {GIT_TIMEOUT} seconds."
+    if status_result.returncode != 0:
         return f"  - {nickname}:\n  Status: Not a Git repository."
 
     status_summary = " Up to date"
-    if status:
+    if status_result.stdout:
         status_summary = " Uncommitted changes"
 
-    last_commit, error = run_command('git log -n 1 --pretty=format:"%s (%cr)"', cwd=project_path)
-    if error:
+    last_commit = log_result.stdout
+    if log_result.timed_out:
+        last_commit = f"Timed out after {GIT_TIMEOUT} seconds"
+    elif log_result.returncode != 0:
         last_commit = "No commits found"
 
     return f"   - {nickname}:\n  Status: {status_summary}\n   Last Commit: {last_commit}"
 
+async def collect_project_statuses(projects):
+    """
+    Probes every registered project concurrently on the shared process runner.
+    Both git commands for all projects are started together, bounded by its concurrency limit.
+    """
+    existing = [(nickname, details['local_path']) for nickname, details in projects.items()
+                if os.path.isdir(details['local_path'])]
+
+    commands = []
+    for _, project_path in existing:
+        commands.append((STATUS_COMMAND, project_path))
+        commands.append((LAST_COMMIT_COMMAND, project_path))
+    results = await process_runner.run_many(commands, timeout=GIT_TIMEOUT)
+
+    statuses = {}
+    for index, (nickname, _) in enumerate(existing):
+        statuses[nickname] = format_project_status(nickname, results[2 * index], results[2 * index + 1])
+
+    # Keep the registry order, including projects whose path has gone missing.
+    return [statuses.get(nickname, f"\n   - {nickname}:\n    Status: Path not found.") for nickname in projects]
+
 def generate_git_overview():
     """
-    Fetches the status of all registered projects in parallel using threads.
+    Fetches the status of all registered projects concurrently with asyncio subprocesses.
     """
     try:
         with open(PROJECTS_FILE, 'r') as f:
@@ -64,12 +81,13 @@ def generate_git_overview():
 
     print("--- Git Project Overview")
 
+    try:
+        results = asyncio.run(collect_project_statuses(projects))
+    except FileNotFoundError:
+        return "Error: 'git' was not found. Please ensure it is installed and in your PATH."
 
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        results = executor.map(check_project_status, projects.items())
-
-        for result in results:
-            print(result)
+    for result in results:
+        print(result)
 
     print("---------------------------")
     return ""
@@ -95,11 +113,11 @@ def save_workflow(nickname):
 
     # 2. Run safety check & workflow inside the project's directory
 
-    _, error = run_command("git rev-parse --is-inside-work-tree", cwd=project_path)
+    _, error = run_command(["git", "rev-parse", "--is-inside-work-tree"], cwd=project_path)
     if error:
         return "This directory is not a git repository"
 
-    current_branch, error = run_command("git rev-parse --abbrev-ref HEAD", cwd=project_path)
+    current_branch, error = run_command(["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=project_path)
     if error:
         return f"Could not determine current branch: {error}"
 
@@ -107,7 +125,7 @@ def save_workflow(nickname):
          return f"\n⚠️  SAFETY ENGAGED: Cannot save directly on the '{current_branch}' branch."
     print(f"Current branch: '{current_branch}'")
     print("\n--- Review Your Chanegs ---")
-    status_output, _ = run_command("git status", cwd=project_path)
+    status_output, _ = run_command(["git", "status"], cwd=project_path)
     print(status_output)
     print("--------------------------")
 
@@ -122,19 +140,17 @@ def save_workflow(nickname):
         return "Commit message cannot be empty. Aborting."
 
     print("\nStep 1: Staging all changes...")
-    _, error = run_command("git add .", cwd=project_path)
+    _, error = run_command(["git", "add", "."], cwd=project_path)
     if error: return f"Error staging files: {error}"
     print("...Done.")
 
     print("\nStep 2: Committing changes...")
-    commit_command = f'git commit -m "{commit_message}"'
-    _, error = run_command(commit_command, cwd=project_path)
+    _, error = run_command(["git", "commit", "-m", commit_message], cwd=project_path)
     if error: return f"Error committing files: {error}"
     print(f"... Committed with message: '{commit_message}'")
 
     print(f"\nStep 3: Pushing to remote branch '{current_branch}'...")
-    push_command = f"git push origin {current_branch}"
-    _, error = run_command(push_command, cwd=project_path)
+    _, error = run_command(["git", "push", "origin", current_branch], cwd=project_path)
     if error: return f"Error pushing to remote: {error}"
     print("... Done.")
 
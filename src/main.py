@@ -54,20 +54,35 @@ def main():
     news_parser.add_argument(
         '--source',
         type=str,
-        default='hackernews',
-        help='The news source to fetch from (e.g., hackernews, techcrunch).'
+        default=None,
+        help='The news source to fetch from (e.g., hackernews, techcrunch). Defaults to hackernews.'
     )
     # Add an optionalargument '--limit'.
     news_parser.add_argument(
         '--limit',
         type=int,
-        default=7,
-        help='The number of arcticles to display.'
+        default=None,
+        help='The number of arcticles to display. Defaults to 7.'
+    )
+    news_parser.add_argument(
+        '--new-only',
+        action='store_true',
+        help='Only show articles that have not been shown before.'
     )
 
+    # Optional action: 'search' answers from the local headline archive instead of the feeds.
+    news_actions = news_parser.add_subparsers(dest='action', help='News actions')
+    search_news_parser = news_actions.add_parser('search', help='Search previously fetched headlines.')
+    search_news_parser.add_argument('query', type=str, help='Words to search for in headline titles.')
+    search_news_parser.add_argument('--since', type=str, default=None, help='Only show articles published since then (e.g. 12h, 3d, 2w, 2025-01-31).')
+    # Own dests, so these options don't overwrite the 'news' level '--source'/'--limit' values.
+    search_news_parser.add_argument('--source', dest='search_source', type=str, default=None, help='Only search headlines from this news source.')
+    search_news_parser.add_argument('--limit', dest='search_limit', type=int, default=None, help='The number of articles to display. Defaults to 20.')
+
     # New command: 'project create'
     create_parser = project_actions.add_parser('create', help='create a new project using a template.')
     create_parser.add_argument('name', type=str, help='The name of new project.')
+    create_parser.add_argument('--install', action='store_true', help='Install dependencies from the shared package store after creating the project.')
 
     # Action Command: 'ace save'
     git_parser = subparsers.add_parser('save', help='The Vanguard: Save your project work.')
@@ -121,7 +136,7 @@ def main():
 
             os.makedirs(final_location, exist_ok=True)
 
-            result = project_scaffolder.create_project(args.name, template, final_location)
+            result = project_scaffolder.create_project(args.name, template, final_location, install=args.install)
             print(result)
 
 
@@ -143,11 +158,30 @@ def main():
             # We print the result, which will be our 'cd ...' command or an error.
             print(navigation_command)
     # News logic        
+    elif args.command == 'news' and args.action == 'search':
+        if args.new_only:
+            parser.error("'--new-only' cannot be used with 'news search'.")
+
+        # Options given before 'search' apply too, unless repeated after it.
+        source_name = args.search_source or args.source
+        limit = args.search_limit if args.search_limit is not None else args.limit
+        if limit is None:
+            limit = 20
+        headlines = news_hub.search_news(args.query, since=args.since, source_name=source_name, limit=limit)
+
+        print(f"\n--- Archive results for '{args.query}' ---")
+        for headline in headlines:
+            print(headline)
+        print("------------------------------")
+
     elif args.command == 'news':
+        source_name = args.source or 'hackernews'
+        limit = args.limit if args.limit is not None else 7
+
         # Call the get_news function from our news_hub.
-        headlines = news_hub.get_news(source_name=args.source, limit=args.limit)
+        headlines = news_hub.get_news(source_name=source_name, limit=limit, new_only=args.new_only)
 
-        print(f"\n--- Latest from {args.source.title()} ---")
+        print(f"\n--- Latest from {source_name.title()} ---")
 
         # Loop through headlines & print each.
         for headline in headlines: